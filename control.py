@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 import argparse
 import asyncio
-from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple
+import struct
+from collections import deque
+from dataclasses import dataclass
+from itertools import count
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple, Union
 
 import pygame
 from bleak import BleakClient
@@ -15,6 +19,12 @@ BATTERY_CHARACTERISTIC_UUID = "00002a19-0000-1000-8000-00805f9b34fb"
 
 QueueItem = Tuple[str, Optional[object]]
 
+UI_QUEUE_SIZE = 128
+# How long the mainloop sleeps between input polls unless the UI wakes it (~30 fps).
+FRAME_TIMEOUT = 1 / 30
+# How long stop() waits for the writer to flush the final payload.
+STOP_FLUSH_TIMEOUT = 1.0
+
 
 @dataclass
 class ControlState:
@@ -26,45 +36,132 @@ class ControlState:
     donut: bool = False
     battery_pct: Optional[int] = None
     last_payload: bytes = b""
-    last_status: Dict[str, int] = field(default_factory=dict)
-    last_status_hex: str = ""
+    last_payload_hex: str = "--"
+    last_status_text: str = "--"
     message: str = ""
 
 
-def build_control_payload(state: ControlState) -> bytes:
-    return bytes(
-        [
-            state.mode & 0xFF,
-            1 if state.throttle > 0 else 0,
-            1 if state.throttle < 0 else 0,
-            1 if state.steering < 0 else 0,
-            1 if state.steering > 0 else 0,
-            int(state.lights),
-            int(state.turbo),
-            int(state.donut),
-        ]
+class RingQueue:
+    """UI event queue that keeps only the latest event of each kind.
+
+    Status, battery and payload events are snapshots of the shared state, so a
+    burst of them collapses to the freshest one. Log lines (message, warn,
+    error) are kept in a bounded buffer that drops the oldest entry. Every put
+    is stamped with a sequence number so drain() returns items in put order.
+    """
+
+    _LOG_KINDS = frozenset({"message", "warn", "error"})
+
+    def __init__(self, maxlen: int = UI_QUEUE_SIZE) -> None:
+        self._log: "deque[Tuple[int, QueueItem]]" = deque(maxlen=maxlen)
+        self._latest: Dict[str, Tuple[int, Optional[object]]] = {}
+        self._seq = count()
+        self._event = asyncio.Event()
+
+    def put_nowait(self, item: QueueItem) -> None:
+        seq = next(self._seq)
+        kind, data = item
+        if kind in self._LOG_KINDS:
+            self._log.append((seq, item))
+        else:
+            self._latest[kind] = (seq, data)
+        self._event.set()
+
+    async def drain(self) -> List[QueueItem]:
+        while self.empty():
+            await self._event.wait()
+        self._event.clear()
+        entries = list(self._log)
+        self._log.clear()
+        entries.extend((seq, (kind, data)) for kind, (seq, data) in self._latest.items())
+        self._latest.clear()
+        entries.sort(key=itemgetter(0))
+        return [item for _, item in entries]
+
+    def empty(self) -> bool:
+        return not self._log and not self._latest
+
+
+CONTROL_PAYLOAD_SIZE = 8
+
+
+def fill_control_payload(buf: bytearray, state: ControlState) -> None:
+    buf[0] = state.mode & 0xFF
+    buf[1] = 1 if state.throttle > 0 else 0
+    buf[2] = 1 if state.throttle < 0 else 0
+    buf[3] = 1 if state.steering < 0 else 0
+    buf[4] = 1 if state.steering > 0 else 0
+    buf[5] = int(state.lights)
+    buf[6] = int(state.turbo)
+    buf[7] = int(state.donut)
+
+
+def _payload_key(state: ControlState) -> Tuple[int, bool, bool, bool, bool, bool, bool, bool]:
+    return (
+        state.mode,
+        state.throttle > 0,
+        state.throttle < 0,
+        state.steering < 0,
+        state.steering > 0,
+        state.lights,
+        state.turbo,
+        state.donut,
     )
 
 
-def decode_status_payload(data: bytes) -> Dict[str, int]:
+def _build_payload_table() -> Dict[tuple, bytes]:
+    table: Dict[tuple, bytes] = {}
+    buf = bytearray(CONTROL_PAYLOAD_SIZE)
+    flags = (False, True)
+    for mode in (1, 2):
+        for throttle in (-1, 0, 1):
+            for steering in (-1, 0, 1):
+                for lights in flags:
+                    for turbo in flags:
+                        for donut in flags:
+                            state = ControlState(
+                                mode=mode,
+                                throttle=throttle,
+                                steering=steering,
+                                lights=lights,
+                                turbo=turbo,
+                                donut=donut,
+                            )
+                            fill_control_payload(buf, state)
+                            table[_payload_key(state)] = bytes(buf)
+    return table
+
+
+# Every reachable control payload, keyed by _payload_key().
+_PAYLOAD_TABLE = _build_payload_table()
+
+
+def build_control_payload(state: ControlState) -> bytes:
+    payload = _PAYLOAD_TABLE.get(_payload_key(state))
+    if payload is None:
+        buf = bytearray(CONTROL_PAYLOAD_SIZE)
+        fill_control_payload(buf, state)
+        payload = bytes(buf)
+    return payload
+
+
+_STATUS_KEYS = ("mode", "forward", "reverse", "left", "right", "lights", "turbo", "donut")
+_UNPACK8 = struct.Struct("<8B").unpack
+
+
+def decode_status_payload(data: Union[bytes, bytearray]) -> Dict[str, int]:
     length = len(data)
     if length == 1:
         return {"length": length, "battery_pct": data[0]}
     if length == 8:
-        return {
-            "length": length,
-            "mode": data[0],
-            "forward": data[1],
-            "reverse": data[2],
-            "left": data[3],
-            "right": data[4],
-            "lights": data[5],
-            "turbo": data[6],
-            "donut": data[7],
-        }
+        return {"length": length, **dict(zip(_STATUS_KEYS, _UNPACK8(data)))}
     return {"length": length, "raw": data.hex()}
 
 
+def format_status(decoded: Dict[str, int]) -> str:
+    return ", ".join(f"{k}={v}" for k, v in decoded.items() if k != "length")
+
+
 def throttle_label(value: int) -> str:
     if value > 0:
         return "Forward"
@@ -81,42 +178,63 @@ def steering_label(value: int) -> str:
     return "Straight"
 
 
+# Axis keys map to a mask bit: bit0 pushes the axis to +1, bit1 to -1.
+_THROTTLE_BITS = {pygame.K_w: 0b01, pygame.K_s: 0b10}
+_STEERING_BITS = {pygame.K_d: 0b01, pygame.K_a: 0b10}
+# Axis value indexed by (mask << 1) | last_pressed_was_negative.
+_AXIS_TABLE = (0, 0, 1, 1, -1, -1, 1, -1)
+_TOGGLE_KEYS = {
+    pygame.K_l: "l",
+    pygame.K_t: "t",
+    pygame.K_o: "o",
+    pygame.K_m: "m",
+    pygame.K_b: "b",
+    pygame.K_q: "q",
+}
+
+
 class BleController:
     def __init__(
         self,
-        loop: asyncio.AbstractEventLoop,
         address: str,
         state: ControlState,
-        ui_queue: "asyncio.Queue[QueueItem]",
+        ui_queue: RingQueue,
     ) -> None:
-        self.loop = loop
         self.address = address
         self.state = state
         self.ui_queue = ui_queue
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._client: Optional[BleakClient] = None
         self._status_notify = False
         self._battery_notify = False
         self._stop_event = asyncio.Event()
-        self._write_lock = asyncio.Lock()
+        self._payload_event = asyncio.Event()
+        self._battery_refresh = False
+        self._writer_task: Optional["asyncio.Task[None]"] = None
         self._pending_payload: Optional[bytes] = None
+        self._inflight_payload: Optional[bytes] = None
         self._last_sent_payload: Optional[bytes] = None
         self._stopped = False
 
     async def run(self) -> None:
+        self._loop = asyncio.get_running_loop()
         self._queue_ui(("message", f"Connecting to {self.address}..."))
         try:
             async with BleakClient(self.address) as client:
                 self._client = client
                 self._queue_ui(("connected", None))
                 await self._enable_notifications(client)
-                await self._send_pending()
-                await self._read_battery(client)
+                self._writer_task = asyncio.create_task(self._writer_loop(client))
+                self._schedule_battery_read()
                 await self._stop_event.wait()
         except asyncio.CancelledError:
             raise
         except Exception as exc:  # pragma: no cover - best effort logging
             self._queue_ui(("error", f"Connection error: {exc}"))
         finally:
+            if self._writer_task is not None:
+                self._writer_task.cancel()
+                self._writer_task = None
             await self._disable_notifications()
             self._client = None
             self._queue_ui(("disconnected", None))
@@ -153,21 +271,15 @@ class BleController:
                 self._battery_notify = False
 
     def _status_handler(self, _: int, data: bytearray) -> None:
-        payload = bytes(data)
-        decoded = decode_status_payload(payload)
-        self.state.last_status = decoded
-        self.state.last_status_hex = payload.hex()
+        self.state.last_status_text = format_status(decode_status_payload(data))
         self._queue_ui(("status", None))
 
     def _battery_handler(self, _: int, data: bytearray) -> None:
-        payload = bytes(data)
-        decoded = decode_status_payload(payload)
-        battery = decoded.get("battery_pct")
-        if battery is None and payload:
-            battery = payload[0]
-        if battery is not None:
-            self.state.battery_pct = int(battery)
-            self._queue_ui(("battery", int(battery)))
+        # 0x2A19 carries the percentage in the first byte whatever the length.
+        if data:
+            battery = int(data[0])
+            self.state.battery_pct = battery
+            self._queue_ui(("battery", battery))
         else:
             self._queue_ui(("status", None))
 
@@ -175,65 +287,100 @@ class BleController:
         try:
             data = await client.read_gatt_char(BATTERY_CHARACTERISTIC_UUID)
         except Exception as exc:
-            self._queue_ui(("warn", f"Initial battery read failed: {exc}"))
+            self._queue_ui(("warn", f"Battery read failed: {exc}"))
             return
         if data:
             self.state.battery_pct = int(data[0])
             self._queue_ui(("battery", int(data[0])))
 
-    async def send_control(self, payload: bytes) -> None:
+    def send_control(self, payload: bytes) -> None:
         if self._stopped:
             return
-        if payload == self._last_sent_payload and self._pending_payload is None:
+        current = self._inflight_payload or self._last_sent_payload
+        if payload == current and self._pending_payload is None:
             return
         self._pending_payload = payload
-        if self._client:
-            await self._write_pending()
+        self._payload_event.set()
 
-    async def _write_pending(self) -> None:
-        if not self._client:
-            return
-        async with self._write_lock:
-            while self._pending_payload is not None and self._client:
-                payload = self._pending_payload
-                self._pending_payload = None
+    async def _writer_loop(self, client: BleakClient) -> None:
+        while True:
+            await self._payload_event.wait()
+            self._payload_event.clear()
+            payload, self._pending_payload = self._pending_payload, None
+            if self._client is not client:
+                return
+            if payload is not None and payload != (self._inflight_payload or self._last_sent_payload):
+                self._inflight_payload = payload
                 try:
-                    await self._client.write_gatt_char(
+                    await client.write_gatt_char(
                         CONTROL_CHARACTERISTIC_UUID,
                         payload,
                         response=False,
                     )
                 except Exception as exc:
+                    self._inflight_payload = None
                     self._queue_ui(("error", f"ERROR sending command: {exc}"))
-                    break
-                self._last_sent_payload = payload
-                self.state.last_payload = payload
-                self._queue_ui(("payload", payload))
+                else:
+                    self._inflight_payload = None
+                    self._last_sent_payload = payload
+                    self.state.last_payload = payload
+                    self.state.last_payload_hex = payload.hex()
+                    self._queue_ui(("payload", payload))
+            if self._stopped and self._pending_payload is None:
+                return
+            if self._battery_refresh:
+                # Reads go through the writer too, so GATT operations never overlap.
+                self._battery_refresh = False
+                await self._read_battery(client)
 
-    async def request_battery(self) -> None:
+    def request_battery(self) -> None:
         if self._stopped:
             return
-        if not self._client:
-            self._queue_ui(("message", "Battery read queued; waiting for connection"))
+        if not self._battery_notify:
+            self.refresh_battery()
+            return
+        battery = "--" if self.state.battery_pct is None else f"{self.state.battery_pct}%"
+        self._queue_ui(("message", f"Notifications active; last battery={battery}"))
+
+    def refresh_battery(self) -> None:
+        if self._stopped:
             return
-        await self._read_battery(self._client)
+        self._schedule_battery_read()
+        if self._client:
+            self._queue_ui(("message", "Battery refresh requested"))
+        else:
+            self._queue_ui(("message", "Battery read queued; waiting for connection"))
 
-    async def _send_pending(self) -> None:
-        if self._pending_payload is not None and self._client:
-            await self._write_pending()
+    def _schedule_battery_read(self) -> None:
+        self._battery_refresh = True
+        self._payload_event.set()
 
     async def stop(self) -> None:
         if self._stopped:
             return
         self._stopped = True
+        writer = self._writer_task
+        if writer is not None and not writer.done():
+            # Let the writer flush the payload latched before stop, then exit.
+            self._payload_event.set()
+            try:
+                await asyncio.wait_for(writer, STOP_FLUSH_TIMEOUT)
+            except asyncio.TimeoutError:
+                self._queue_ui(("warn", "Timed out flushing final command"))
         self._stop_event.set()
         await self._disable_notifications()
 
     def _queue_ui(self, item: QueueItem) -> None:
+        # Notification callbacks normally run on the event loop, where the put
+        # is a plain store. Some backends call back from their own thread,
+        # where asyncio.Event is not safe to touch, so hand those off.
         try:
-            self.ui_queue.put_nowait(item)
-        except asyncio.QueueFull:
-            pass
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self.ui_queue.put_nowait, item)
+            return
+        self.ui_queue.put_nowait(item)
 
 
 class PygameApp:
@@ -241,25 +388,29 @@ class PygameApp:
     TEXT_COLOR = (230, 230, 230)
     ACCENT_COLOR = (120, 200, 255)
 
-    def __init__(self, loop: asyncio.AbstractEventLoop, address: str) -> None:
-        self.loop = loop
+    def __init__(self, address: str) -> None:
         self.address = address
         self.state = ControlState()
-        self.ui_queue: asyncio.Queue[QueueItem] = asyncio.Queue()
-        self.ble = BleController(loop, address, self.state, self.ui_queue)
+        self.ui_queue = RingQueue(UI_QUEUE_SIZE)
+        self.ble = BleController(address, self.state, self.ui_queue)
 
         self.running = False
         self.message = ""
 
-        self.throttle_keys_down: set[str] = set()
-        self.steering_keys_down: set[str] = set()
+        self._throttle_mask = 0
+        self._throttle_last = 0
+        self._steering_mask = 0
+        self._steering_last = 0
         self.toggle_keys_down: set[str] = set()
-        self.last_throttle_key: Optional[str] = None
-        self.last_steering_key: Optional[str] = None
 
         self.screen: Optional[pygame.Surface] = None
         self.font: Optional[pygame.font.Font] = None
         self.small_font: Optional[pygame.font.Font] = None
+        self._instructions_surface: Optional[pygame.Surface] = None
+        self._line_cache: Dict[int, Tuple[str, pygame.Surface]] = {}
+        self._wake = asyncio.Event()
+        self._label_surfaces: Dict[str, pygame.Surface] = {}
+        self._dirty = True
 
     async def run(self) -> None:
         pygame.init()
@@ -269,6 +420,12 @@ class PygameApp:
         self.font = pygame.font.SysFont("Segoe UI", 22)
         self.small_font = pygame.font.SysFont("Segoe UI", 16)
         pygame.key.set_repeat(0)
+        self._instructions_surface = self.small_font.render(
+            "Keys: w/s throttle, a/d steering, l lights, t turbo, o donut, m mode, b battery, q quit",
+            True,
+            (180, 180, 180),
+        )
+        self._label_surfaces = self._prerender_labels()
 
         ble_task = asyncio.create_task(self.ble.run())
         ui_task = asyncio.create_task(self.ui_consumer())
@@ -284,115 +441,118 @@ class PygameApp:
 
     async def mainloop(self) -> None:
         self.running = True
-        clock = pygame.time.Clock()
+        loop = asyncio.get_running_loop()
         while self.running:
+            # SDL must pump events on the thread that owns the window, so wait
+            # on the loop thread for a UI wakeup or the frame timeout instead.
+            timeout = loop.call_later(FRAME_TIMEOUT, self._wake.set)
+            await self._wake.wait()
+            timeout.cancel()
+            self._wake.clear()
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.loop.create_task(self.shutdown())
-                elif event.type == pygame.KEYDOWN:
-                    self.handle_keydown(event)
-                elif event.type == pygame.KEYUP:
-                    self.handle_keyup(event)
-
+                self.handle_event(event)
             self.draw()
-            await asyncio.sleep(0)
-            clock.tick(60)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.QUIT:
+            asyncio.create_task(self.shutdown())
+        elif event.type == pygame.KEYDOWN:
+            self.handle_keydown(event)
+        elif event.type == pygame.KEYUP:
+            self.handle_keyup(event)
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self._dirty = True
 
     def handle_keydown(self, event: pygame.event.Event) -> None:
         if not self.running:
             return
-        key_name = pygame.key.name(event.key).lower()
-        if key_name in {"w", "s"}:
-            self.throttle_keys_down.add(key_name)
-            self.last_throttle_key = key_name
-            if self._update_throttle_from_keys():
-                self.loop.create_task(self.ble.send_control(build_control_payload(self.state)))
-        elif key_name in {"a", "d"}:
-            self.steering_keys_down.add(key_name)
-            self.last_steering_key = key_name
-            if self._update_steering_from_keys():
-                self.loop.create_task(self.ble.send_control(build_control_payload(self.state)))
-        elif key_name in {"l", "t", "o", "m", "b", "q"}:
-            if key_name not in self.toggle_keys_down:
-                self.toggle_keys_down.add(key_name)
-                self._handle_toggle_press(key_name)
+        self._dirty = True
+        key = event.key
+        bit = _THROTTLE_BITS.get(key)
+        if bit is not None:
+            if not self._throttle_mask & bit:
+                self._throttle_mask |= bit
+                self._throttle_last = bit >> 1
+                self._set_throttle(_AXIS_TABLE[(self._throttle_mask << 1) | self._throttle_last])
+            return
+        bit = _STEERING_BITS.get(key)
+        if bit is not None:
+            if not self._steering_mask & bit:
+                self._steering_mask |= bit
+                self._steering_last = bit >> 1
+                self._set_steering(_AXIS_TABLE[(self._steering_mask << 1) | self._steering_last])
+            return
+        key_name = _TOGGLE_KEYS.get(key)
+        if key_name is not None and key_name not in self.toggle_keys_down:
+            self.toggle_keys_down.add(key_name)
+            self._handle_toggle_press(key_name)
 
     def handle_keyup(self, event: pygame.event.Event) -> None:
-        key_name = pygame.key.name(event.key).lower()
-        if key_name in self.throttle_keys_down:
-            self.throttle_keys_down.discard(key_name)
-            if self._update_throttle_from_keys():
-                self.loop.create_task(self.ble.send_control(build_control_payload(self.state)))
-        elif key_name in self.steering_keys_down:
-            self.steering_keys_down.discard(key_name)
-            if self._update_steering_from_keys():
-                self.loop.create_task(self.ble.send_control(build_control_payload(self.state)))
-        if key_name in self.toggle_keys_down:
+        self._dirty = True
+        key = event.key
+        bit = _THROTTLE_BITS.get(key)
+        if bit is not None:
+            if self._throttle_mask & bit:
+                self._throttle_mask &= ~bit
+                self._set_throttle(_AXIS_TABLE[(self._throttle_mask << 1) | self._throttle_last])
+            return
+        bit = _STEERING_BITS.get(key)
+        if bit is not None:
+            if self._steering_mask & bit:
+                self._steering_mask &= ~bit
+                self._set_steering(_AXIS_TABLE[(self._steering_mask << 1) | self._steering_last])
+            return
+        key_name = _TOGGLE_KEYS.get(key)
+        if key_name is not None:
             self.toggle_keys_down.discard(key_name)
 
-    def _update_throttle_from_keys(self) -> bool:
-        old = self.state.throttle
-        if "w" in self.throttle_keys_down and "s" in self.throttle_keys_down:
-            new_value = 1 if self.last_throttle_key == "w" else -1
-        elif "w" in self.throttle_keys_down:
-            new_value = 1
-        elif "s" in self.throttle_keys_down:
-            new_value = -1
-        else:
-            new_value = 0
-        if new_value != old:
-            self.state.throttle = new_value
-            self.state.message = throttle_label(new_value)
-            return True
-        return False
-
-    def _update_steering_from_keys(self) -> bool:
-        old = self.state.steering
-        if "a" in self.steering_keys_down and "d" in self.steering_keys_down:
-            new_value = -1 if self.last_steering_key == "a" else 1
-        elif "a" in self.steering_keys_down:
-            new_value = -1
-        elif "d" in self.steering_keys_down:
-            new_value = 1
-        else:
-            new_value = 0
-        if new_value != old:
-            self.state.steering = new_value
-            self.state.message = steering_label(new_value)
-            return True
-        return False
+    def _set_throttle(self, value: int) -> None:
+        if value != self.state.throttle:
+            self.state.throttle = value
+            self.state.message = throttle_label(value)
+            self.ble.send_control(build_control_payload(self.state))
+
+    def _set_steering(self, value: int) -> None:
+        if value != self.state.steering:
+            self.state.steering = value
+            self.state.message = steering_label(value)
+            self.ble.send_control(build_control_payload(self.state))
 
     def _handle_toggle_press(self, key_name: str) -> None:
         if key_name == "l":
             self.state.lights = not self.state.lights
             self.state.message = f"Lights {'ON' if self.state.lights else 'OFF'}"
-            self.loop.create_task(self.ble.send_control(build_control_payload(self.state)))
+            self.ble.send_control(build_control_payload(self.state))
         elif key_name == "t":
             self.state.turbo = not self.state.turbo
             self.state.message = f"Turbo {'ON' if self.state.turbo else 'OFF'}"
-            self.loop.create_task(self.ble.send_control(build_control_payload(self.state)))
+            self.ble.send_control(build_control_payload(self.state))
         elif key_name == "o":
             self.state.donut = not self.state.donut
             self.state.message = f"Donut {'ON' if self.state.donut else 'OFF'}"
-            self.loop.create_task(self.ble.send_control(build_control_payload(self.state)))
+            self.ble.send_control(build_control_payload(self.state))
         elif key_name == "m":
             self.state.mode = 2 if self.state.mode == 1 else 1
             self.state.message = f"Mode set to {self.state.mode}"
-            self.loop.create_task(self.ble.send_control(build_control_payload(self.state)))
+            self.ble.send_control(build_control_payload(self.state))
         elif key_name == "b":
-            self.state.message = "Battery refresh requested"
-            self.loop.create_task(self.ble.request_battery())
+            self.ble.request_battery()
         elif key_name == "q":
-            self.loop.create_task(self.shutdown())
+            asyncio.create_task(self.shutdown())
 
     async def ui_consumer(self) -> None:
-        while True:
-            kind, data = await self.ui_queue.get()
-            if kind == "shutdown":
-                break
-            self._handle_ui_message(kind, data)
+        running = True
+        while running:
+            for kind, data in await self.ui_queue.drain():
+                if kind == "shutdown":
+                    running = False
+                else:
+                    self._handle_ui_message(kind, data)
+            if self._dirty:
+                self._wake.set()
 
     def _handle_ui_message(self, kind: str, data: Optional[object]) -> None:
+        self._dirty = True
         if kind == "message":
             self.message = str(data)
         elif kind == "warn":
@@ -405,9 +565,8 @@ class PygameApp:
         elif kind == "status":
             self.message = "Status notification received"
         elif kind == "payload":
-            payload = data if isinstance(data, bytes) else b""
-            self.state.last_payload = payload
-            self.message = f"Command sent: {payload.hex() if payload else '--'}"
+            # The writer already stored last_payload/last_payload_hex on the state.
+            self.message = f"Command sent: {self.state.last_payload_hex}"
         elif kind == "connected":
             self.message = "Connected"
         elif kind == "disconnected":
@@ -418,17 +577,22 @@ class PygameApp:
         if not self.running:
             return
         self.running = False
-        self.throttle_keys_down.clear()
-        self.steering_keys_down.clear()
+        self._throttle_mask = 0
+        self._steering_mask = 0
         self.toggle_keys_down.clear()
         self.state.throttle = 0
         self.state.steering = 0
-        await self.ble.send_control(build_control_payload(self.state))
+        # send_control only skips this when the zero-motion payload was the last
+        # one written and nothing is in flight or pending.
+        self.ble.send_control(build_control_payload(self.state))
         await self.ble.stop()
 
     def draw(self) -> None:
-        if not self.screen or not self.font or not self.small_font:
+        if not self.screen or not self.font or not self._instructions_surface:
             return
+        if not self._dirty:
+            return
+        self._dirty = False
         self.screen.fill(self.BG_COLOR)
 
         lines = [
@@ -440,33 +604,40 @@ class PygameApp:
             f"Lights: {'ON' if self.state.lights else 'OFF'}",
             f"Turbo: {'ON' if self.state.turbo else 'OFF'}",
             f"Donut: {'ON' if self.state.donut else 'OFF'}",
-            f"Last payload: {self.state.last_payload.hex() if self.state.last_payload else '--'}",
-            f"Last status: {self._format_last_status()}",
+            f"Last payload: {self.state.last_payload_hex}",
+            f"Last status: {self.state.last_status_text}",
         ]
 
         for idx, text in enumerate(lines):
-            surface = self.font.render(text, True, self.TEXT_COLOR)
+            surface = self._render_line(idx, text, self.TEXT_COLOR)
             self.screen.blit(surface, (24, 24 + idx * 28))
 
         message = self.message or self.state.message or "--"
-        message_surface = self.font.render(f"Message: {message}", True, self.ACCENT_COLOR)
+        message_surface = self._render_line(len(lines), f"Message: {message}", self.ACCENT_COLOR)
         self.screen.blit(message_surface, (24, 24 + len(lines) * 28 + 12))
 
-        instructions = (
-            "Keys: w/s throttle, a/d steering, l lights, t turbo, o donut, m mode, b battery, q quit"
-        )
-        instructions_surface = self.small_font.render(instructions, True, (180, 180, 180))
-        self.screen.blit(instructions_surface, (24, self.screen.get_height() - 40))
+        self.screen.blit(self._instructions_surface, (24, self.screen.get_height() - 40))
 
         pygame.display.flip()
 
-    def _format_last_status(self) -> str:
-        if self.state.last_status:
-            items = [f"{k}={v}" for k, v in self.state.last_status.items() if k != "length"]
-            return ", ".join(items) if items else str(self.state.last_status)
-        if self.state.last_status_hex:
-            return self.state.last_status_hex
-        return "--"
+    def _render_line(self, idx: int, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        cached = self._line_cache.get(idx)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        surface = self._label_surfaces.get(text) if color == self.TEXT_COLOR else None
+        if surface is None:
+            surface = self.font.render(text, True, color)
+        self._line_cache[idx] = (text, surface)
+        return surface
+
+    def _prerender_labels(self) -> Dict[str, pygame.Surface]:
+        labels = ["Battery: --", "Mode: 1", "Mode: 2"]
+        labels.extend(f"Battery: {pct}%" for pct in range(101))
+        labels.extend(f"Throttle: {throttle_label(value)}" for value in (-1, 0, 1))
+        labels.extend(f"Steering: {steering_label(value)}" for value in (-1, 0, 1))
+        for name in ("Lights", "Turbo", "Donut"):
+            labels.extend((f"{name}: ON", f"{name}: OFF"))
+        return {text: self.font.render(text, True, self.TEXT_COLOR) for text in labels}
 
 
 def parse_args() -> argparse.Namespace:
@@ -478,8 +649,7 @@ def parse_args() -> argparse.Namespace:
 
 
 async def main(address: str) -> None:
-    loop = asyncio.get_running_loop()
-    app = PygameApp(loop, address)
+    app = PygameApp(address)
     await app.run()
 
 
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("pygame")
+pytest.importorskip("bleak")
+
+import control  # noqa: E402
+
+
+class SlowClient:
+    """Fake BleakClient whose writes take long enough to overlap a shutdown."""
+
+    def __init__(self, address: str) -> None:
+        self.writes = []
+
+    async def __aenter__(self) -> "SlowClient":
+        SlowClient.instance = self
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    async def start_notify(self, uuid, callback) -> None:
+        pass
+
+    async def stop_notify(self, uuid) -> None:
+        pass
+
+    async def read_gatt_char(self, uuid) -> bytearray:
+        return bytearray([50])
+
+    async def write_gatt_char(self, uuid, payload, response) -> None:
+        await asyncio.sleep(0.01)
+        self.writes.append(bytes(payload))
+
+
+def test_stop_payload_flushed_while_write_in_flight(monkeypatch):
+    monkeypatch.setattr(control, "BleakClient", SlowClient)
+
+    async def scenario() -> None:
+        state = control.ControlState()
+        ble = control.BleController("00:00:00:00:00:00", state, control.RingQueue())
+        task = asyncio.create_task(ble.run())
+        await asyncio.sleep(0.02)
+
+        state.throttle = 1
+        ble.send_control(control.build_control_payload(state))
+        await asyncio.sleep(0.001)  # writer is now inside write_gatt_char
+
+        state.throttle = 0
+        stop_payload = control.build_control_payload(state)
+        ble.send_control(stop_payload)
+        await ble.stop()
+        await task
+
+        assert SlowClient.instance.writes[-1] == stop_payload
+
+    asyncio.run(scenario())
+
+
+def test_stop_payload_resent_after_in_flight_forward_write(monkeypatch):
+    monkeypatch.setattr(control, "BleakClient", SlowClient)
+
+    async def scenario() -> None:
+        state = control.ControlState()
+        ble = control.BleController("00:00:00:00:00:00", state, control.RingQueue())
+        task = asyncio.create_task(ble.run())
+        await asyncio.sleep(0.02)
+
+        stop_payload = control.build_control_payload(state)
+        ble.send_control(stop_payload)
+        await asyncio.sleep(0.03)  # stop payload fully written
+        assert SlowClient.instance.writes == [stop_payload]
+
+        state.throttle = 1
+        ble.send_control(control.build_control_payload(state))
+        await asyncio.sleep(0.001)  # writer is now inside write_gatt_char
+
+        state.throttle = 0
+        ble.send_control(control.build_control_payload(state))
+        await ble.stop()
+        await task
+
+        assert SlowClient.instance.writes[-1] == stop_payload
+
+    asyncio.run(scenario())
+
+
+def test_ring_queue_drain_keeps_put_order():
+    async def scenario() -> None:
+        queue = control.RingQueue()
+        queue.put_nowait(("payload", b"\x01"))
+        queue.put_nowait(("error", "ERROR sending command"))
+        queue.put_nowait(("battery", 40))
+        queue.put_nowait(("warn", "Battery notify failed"))
+        queue.put_nowait(("battery", 41))
+
+        assert await queue.drain() == [
+            ("payload", b"\x01"),
+            ("error", "ERROR sending command"),
+            ("warn", "Battery notify failed"),
+            ("battery", 41),
+        ]
+
+    asyncio.run(scenario())